@@ -33,7 +33,7 @@ class TeamsCog(BaseCog, name="Teams"):
         message = await (
             Mediator.send_async(query)
             .map(  # type: ignore[arg-type, return-value]  # pyright: ignore[reportUnknownLambdaType]
-                lambda value: (f"Team Information:\nID: {value.id}\nName: {value.name}")
+                lambda value: f"Team Information:\nID: {value.id}\nName: {value.name}"
             )
             .unwrap()
         )
@@ -53,7 +53,7 @@ class TeamsCog(BaseCog, name="Teams"):
                 lambda result: Mediator.send_async(GetTeamQuery(id=result.id))
             )
             .map(  # type: ignore[arg-type, return-value]
-                lambda value: (f"Team Created:\nID: {value.id}\nName: {value.name}")
+                lambda value: f"Team Created:\nID: {value.id}\nName: {value.name}"
             )
             .unwrap()
         )
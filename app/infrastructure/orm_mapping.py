@@ -252,6 +252,7 @@ class ORMMappingRegistry:
     """
 
     _domain_to_orm: ClassVar[dict[type, type[SQLModel]]] = {}
+    _orm_to_domain: ClassVar[dict[type[SQLModel], type]] = {}
 
     @classmethod
     def register(
@@ -266,6 +267,13 @@ class ORMMappingRegistry:
             orm_type: ORM model class (e.g., UserORM, TeamORM)
         """
         cls._domain_to_orm[domain_type] = orm_type
+
+        # Rebuild the reverse index so an ORM type shared by several domain
+        # types resolves to the first one registered, as a linear scan would
+        orm_to_domain: dict[type[SQLModel], type] = {}
+        for mapped_domain, mapped_orm in cls._domain_to_orm.items():
+            orm_to_domain.setdefault(mapped_orm, mapped_domain)
+        cls._orm_to_domain = orm_to_domain
         logger.debug(
             f"Registered ORM mapping: {domain_type.__name__} <-> {orm_type.__name__}"
         )
@@ -322,14 +330,15 @@ class ORMMappingRegistry:
         """
         # Find domain type by ORM type
         orm_type = type(orm_instance)
-        for domain_type, registered_orm_type in cls._domain_to_orm.items():
-            if registered_orm_type == orm_type:
-                # Use automatic conversion
-                return orm_to_entity(orm_instance, domain_type)
+        domain_type = cls._orm_to_domain.get(orm_type)
 
-        raise ValueError(
-            f"No domain mapping registered for ORM type: {orm_type.__name__}"
-        )
+        if domain_type is None:
+            raise ValueError(
+                f"No domain mapping registered for ORM type: {orm_type.__name__}"
+            )
+
+        # Use automatic conversion
+        return orm_to_entity(orm_instance, domain_type)
 
     @classmethod
     def get_mapping_dict(cls) -> dict[type, type[SQLModel]]:
@@ -1,46 +1,114 @@
 """Pytest configuration and fixtures."""
 
+import dataclasses
+import os
 from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta, tzinfo
+from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from injector import Injector
+from sqlalchemy import Connection, event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel
 
+from app import container
+from app.domain.aggregates import Team, User
 from app.domain.repositories import IUnitOfWork
+from app.domain.value_objects import DisplayName, Email, TeamName
 from app.infrastructure.orm_registry import init_orm_mappings
+from app.infrastructure.repositories import generic_repository
 from app.infrastructure.unit_of_work import SQLAlchemyUnitOfWork
+from tests.fakes import FakeUnitOfWork
 
 # Initialize ORM mappings before any tests
 init_orm_mappings()
 
 
-@pytest.fixture(scope="function")
-async def test_db_engine() -> AsyncGenerator[None, None]:
-    """Create test database engine with in-memory SQLite."""
-    test_url = "sqlite+aiosqlite:///:memory:"
+@pytest.fixture(scope="session")
+def test_db_url() -> str:
+    """Name the in-memory SQLite database after the pytest-xdist worker.
+
+    Each worker (``gw0``, ``gw1``, ... or ``master`` without ``-n``) gets its
+    own database and creates its schema once, so tests can run in parallel
+    with ``pytest -n auto``.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    return (
+        f"sqlite+aiosqlite:///file:test_{worker_id}?mode=memory&cache=shared&uri=true"
+    )
+
+
+def _disable_driver_transactions(dbapi_connection: Any, connection_record: Any) -> None:
+    """Stop the sqlite3 driver from opening transactions on its own."""
+    dbapi_connection.isolation_level = None
+
+
+def _emit_begin(conn: Connection) -> None:
+    """Start each SQLAlchemy transaction with an explicit BEGIN."""
+    conn.exec_driver_sql("BEGIN")
 
-    engine = create_async_engine(test_url, echo=False)
+
+@pytest.fixture(scope="session")
+async def db_engine(test_db_url: str) -> AsyncGenerator[AsyncEngine, None]:
+    """Create the test database engine and schema once per session.
+
+    The in-memory database lives on the single StaticPool connection, so
+    every test reuses that connection instead of reconnecting.
+    """
+    engine = create_async_engine(
+        test_db_url, echo=False, poolclass=StaticPool, query_cache_size=1200
+    )
+
+    # The sqlite3 driver manages transactions itself and mishandles
+    # SAVEPOINT, so let SQLAlchemy emit BEGIN explicitly instead.
+    event.listen(engine.sync_engine, "connect", _disable_driver_transactions)
+    event.listen(engine.sync_engine, "begin", _emit_begin)
 
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture(scope="function")
+async def test_db_engine(db_engine: AsyncEngine) -> AsyncGenerator[None, None]:
+    """Run the test inside a transaction that is rolled back afterwards.
+
+    Sessions join the outer transaction through a SAVEPOINT, so unit of
+    work commits and rollbacks behave normally while nothing persists
+    past the test.
+    """
     from app.infrastructure import database
 
-    old_engine = database._engine
-    old_session_factory = database._session_factory
+    async with db_engine.connect() as conn:
+        transaction = await conn.begin()
 
-    database._engine = engine
-    database._session_factory = async_sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+        old_engine = database._engine
+        old_session_factory = database._session_factory
 
-    yield
+        database._engine = db_engine
+        database._session_factory = async_sessionmaker(
+            conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
 
-    database._engine = old_engine
-    database._session_factory = old_session_factory
-    await engine.dispose()
+        yield
+
+        database._engine = old_engine
+        database._session_factory = old_session_factory
+        await transaction.rollback()
 
 
 @pytest.fixture(scope="function")
@@ -55,15 +123,122 @@ async def session_factory(
     return database._session_factory
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
+def injector() -> Injector:
+    """Provide the application DI container, built once per session.
+
+    Providers are not singletons, so dependencies resolved from it pick up
+    the database installed by ``test_db_engine`` for the current test.
+    """
+    return Injector([container.configure])
+
+
+@pytest.fixture(scope="session")
 def anyio_backend() -> str:
-    """Specify anyio backend for pytest-anyio."""
+    """Run every anyio test on the asyncio backend only.
+
+    Session scope lets async fixtures of any scope share the backend.
+    A test that needs trio must override this fixture locally.
+    """
     return "asyncio"
 
 
+@pytest.fixture(scope="session", autouse=True)
+async def session_event_loop(anyio_backend: str) -> AsyncGenerator[None, None]:
+    """Keep a single event loop running for the whole test session.
+
+    anyio reuses its test runner while a higher-scoped async fixture is
+    active, so holding this one from the start stops every test that runs
+    before the session-scoped database fixture from getting its own loop.
+    """
+    yield
+
+
 @pytest.fixture
 async def uow(
     session_factory: async_sessionmaker[AsyncSession],
 ) -> IUnitOfWork:
     """Provide Unit of Work for tests."""
     return SQLAlchemyUnitOfWork(session_factory)
+
+
+@pytest.fixture
+def fake_uow() -> FakeUnitOfWork:
+    """Provide a Unit of Work fake for tests that never reach the database.
+
+    ``GetRepository`` returns a MagicMock repository, available as
+    ``fake_uow.repository``, that tests can configure further.
+    """
+    return FakeUnitOfWork(MagicMock())
+
+
+@pytest.fixture(scope="module")
+def user_template() -> User:
+    """Provide a User whose value objects are validated once per module."""
+    return User.register(
+        display_name=DisplayName.from_primitive("Test User").expect(
+            "DisplayName.from_primitive should succeed"
+        ),
+        email=Email.from_primitive("test@example.com").expect(
+            "Email.from_primitive should succeed for valid email"
+        ),
+    )
+
+
+@pytest.fixture
+def user(user_template: User) -> User:
+    """Provide a fresh User (new id and timestamps) built from the template."""
+    return dataclasses.replace(user_template)
+
+
+@pytest.fixture(scope="module")
+def team_template() -> Team:
+    """Provide a Team whose value objects are validated once per module."""
+    return Team.form(
+        name=TeamName.from_primitive("Test Team").expect(
+            "TeamName.from_primitive should succeed for valid name"
+        ),
+    )
+
+
+@pytest.fixture
+def team(team_template: Team) -> Team:
+    """Provide a fresh Team (new id and timestamps) built from the template."""
+    return dataclasses.replace(team_template)
+
+
+@pytest.fixture
+async def saved_user(uow: IUnitOfWork, user: User) -> User:
+    """Provide a user that has been added and committed for this test."""
+    async with uow:
+        save_result = await uow.GetRepository(User).add(user)
+        (await uow.commit()).expect("Unit of work commit should succeed")
+    return save_result.expect("User should be saved")
+
+
+@pytest.fixture
+async def saved_team(uow: IUnitOfWork, team: Team) -> Team:
+    """Provide a team that has been added and committed for this test."""
+    async with uow:
+        save_result = await uow.GetRepository(Team).add(team)
+        (await uow.commit()).expect("Unit of work commit should succeed")
+    return save_result.expect("Team should be saved")
+
+
+@pytest.fixture
+def advancing_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make repository timestamps advance by one second on every call.
+
+    Replaces the clock used by GenericRepository so that consecutive
+    updated_at values are strictly increasing without sleeping.
+    """
+    current = datetime.now(UTC)
+
+    class AdvancingDateTime(datetime):
+        @classmethod
+        def now(cls, tz: tzinfo | None = None) -> "AdvancingDateTime":
+            nonlocal current
+            current += timedelta(seconds=1)
+            return cls.fromtimestamp(current.timestamp(), tz)
+
+    monkeypatch.setattr(generic_repository, "datetime", AdvancingDateTime)
@@ -0,0 +1,60 @@
+"""Hand-rolled test doubles shared across the test suite."""
+
+from collections.abc import Iterable
+from typing import Any
+
+from app.core.result import Err, Ok, Result
+from app.domain.repositories import IUnitOfWork, RepositoryError, RepositoryErrorType
+
+
+class FakeUnitOfWork(IUnitOfWork):
+    """Unit of Work double for tests that never reach the database.
+
+    Every ``GetRepository`` call returns the same ``repository`` object, and
+    ``commit`` succeeds unless a test overrides it.
+    """
+
+    def __init__(self, repository: Any) -> None:
+        self.repository = repository
+
+    def GetRepository(  # type: ignore[override]
+        self, entity_type: type[Any], key_type: type[Any] | None = None
+    ) -> Any:
+        """Return the repository this fake was constructed with."""
+        return self.repository
+
+    async def commit(self) -> Result[None, RepositoryError]:
+        """Pretend to commit the transaction."""
+        return Ok(None)
+
+    async def rollback(self) -> None:
+        """Pretend to roll back the transaction."""
+
+    async def __aenter__(self) -> "FakeUnitOfWork":
+        """Enter the context, yielding the fake itself."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Exit the context without touching any transaction."""
+
+
+class FakeRepository:
+    """In-memory repository double keyed by each entity's ``id``.
+
+    Only implements the lookups that read-only handler tests need.
+    """
+
+    def __init__(self, entities: Iterable[Any] = ()) -> None:
+        self._entities = {entity.id: entity for entity in entities}
+
+    async def get_by_id(self, entity_id: Any) -> Result[Any, RepositoryError]:
+        """Return the stored entity, or a NOT_FOUND error."""
+        entity = self._entities.get(entity_id)
+        if entity is None:
+            return Err(
+                RepositoryError(
+                    type=RepositoryErrorType.NOT_FOUND,
+                    message=f"Entity with id {entity_id} not found",
+                )
+            )
+        return Ok(entity)
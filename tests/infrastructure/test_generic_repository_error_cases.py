@@ -1,27 +1,86 @@
 """Tests for GenericRepository error cases to improve coverage."""
 
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
-from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import registry
+from sqlmodel import Field, SQLModel
 
 from app.core.result import is_err, is_ok
 from app.domain.aggregates.team import Team
 from app.domain.aggregates.user import User
 from app.domain.interfaces import IAuditable
 from app.domain.repositories import IUnitOfWork, RepositoryErrorType
-from app.domain.value_objects import (
-    DisplayName,
-    Email,
-    TeamName,
-    UserId,
-)
+from app.domain.value_objects import TeamName, UserId
 from app.infrastructure.orm_mapping import ORMMappingRegistry
 from app.infrastructure.repositories.generic_repository import GenericRepository
 
 
+@dataclass
+class EntityWithoutId(IAuditable):
+    """Dummy entity without id attribute."""
+
+    name: str
+    created_at: datetime
+    updated_at: datetime
+
+
+class IsolatedSQLModel(SQLModel, registry=registry()):
+    """Base for test-only tables kept out of the shared SQLModel metadata.
+
+    The session-wide ``create_all`` only sees ``SQLModel.metadata``, so
+    tables declared here are never created in the test databases.
+    """
+
+
+class EntityWithoutIdORM(IsolatedSQLModel, table=True):
+    """ORM model for entity without id."""
+
+    __tablename__: str = "entity_without_id"  # type: ignore[assignment]
+
+    name: str = Field(primary_key=True)
+    created_at: datetime
+    updated_at: datetime
+
+
+@pytest.fixture(scope="module")
+def entity_without_id_mapping() -> Iterator[None]:
+    """Register the EntityWithoutId ORM mapping for this module only.
+
+    The registry is process-global, so its previous state is restored on
+    teardown to keep the mapping from leaking into other modules.
+    """
+    saved = {
+        name: dict(getattr(ORMMappingRegistry, name))
+        for name in ("_domain_to_orm", "_orm_to_domain")
+    }
+    ORMMappingRegistry.register(EntityWithoutId, EntityWithoutIdORM)
+    yield
+    for name, mapping in saved.items():
+        setattr(ORMMappingRegistry, name, mapping)
+
+
+@pytest.fixture
+def raise_on_execute(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[[object, Exception], None]:
+    """Provide a helper that makes a repository's session.execute raise."""
+
+    def _raise(repo: object, exc: Exception) -> None:
+        async def fail(*args: Any, **kwargs: Any) -> Any:
+            raise exc
+
+        monkeypatch.setattr(repo._session, "execute", fail)  # type: ignore[attr-defined]
+
+    return _raise
+
+
 @pytest.mark.anyio
 async def test_generic_repository_no_orm_mapping_raises_error(
     session_factory: async_sessionmaker[AsyncSession],
@@ -42,51 +101,61 @@ async def test_generic_repository_no_orm_mapping_raises_error(
             GenericRepository(session, UnmappedEntity, int)
 
 
+def _user_id(user: User) -> object:
+    """Build the get_by_id argument for a user."""
+    return user.id
+
+
+def _user_itself(user: User) -> object:
+    """Build the delete argument for a user."""
+    return user
+
+
 @pytest.mark.anyio
-async def test_generic_repository_get_by_id_sqlalchemy_error(
+@pytest.mark.parametrize(
+    ("method", "build_arg", "message"),
+    [
+        ("get_by_id", _user_id, "Database error"),
+        ("delete", _user_itself, "Delete error"),
+    ],
+    ids=["get_by_id", "delete"],
+)
+async def test_generic_repository_sqlalchemy_error(
     uow: IUnitOfWork,
+    user: User,
+    method: str,
+    build_arg: Callable[[User], object],
+    message: str,
+    raise_on_execute: Callable[[object, Exception], None],
 ) -> None:
-    """Test that get_by_id returns RepositoryError on SQLAlchemy error."""
-    user_id = UserId.generate().expect("UserId.generate should succeed")
-
+    """Test that repository queries return RepositoryError on SQLAlchemy error."""
     async with uow:
         repo = uow.GetRepository(User, UserId)
+        raise_on_execute(repo, SQLAlchemyError(message))
 
-        # Mock session.execute to raise SQLAlchemyError
-        with patch.object(
-            repo._session,  # type: ignore[attr-defined]
-            "execute",
-            side_effect=SQLAlchemyError("Database error"),
-        ):
-            result = await repo.get_by_id(user_id)
+        result = await getattr(repo, method)(build_arg(user))
 
         assert is_err(result)
         assert result.error.type == RepositoryErrorType.UNEXPECTED
-        assert "Database error" in result.error.message
+        assert message in result.error.message
 
 
 @pytest.mark.anyio
-async def test_generic_repository_add_sqlalchemy_error(uow: IUnitOfWork) -> None:
-    """Test that add returns RepositoryError on SQLAlchemy error."""
-    user = User.register(
-        display_name=DisplayName.from_primitive("TestUser").expect(
-            "DisplayName.from_primitive should succeed"
-        ),
-        email=Email.from_primitive("test@example.com").expect(
-            "Email.from_primitive should succeed"
-        ),
-    )
+async def test_generic_repository_add_conversion_error(
+    uow: IUnitOfWork,
+    user: User,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that add returns RepositoryError when ORM conversion fails."""
+
+    def fail_to_orm(entity: object) -> Any:
+        raise SQLAlchemyError("Conversion error")
+
+    monkeypatch.setattr(ORMMappingRegistry, "to_orm", fail_to_orm)
 
     async with uow:
         repo = uow.GetRepository(User)
-
-        # Mock ORMMappingRegistry.to_orm to raise SQLAlchemyError
-        with patch.object(
-            ORMMappingRegistry,
-            "to_orm",
-            side_effect=SQLAlchemyError("Conversion error"),
-        ):
-            result = await repo.add(user)
+        result = await repo.add(user)
 
         assert is_err(result)
         assert result.error.type == RepositoryErrorType.UNEXPECTED
@@ -94,34 +163,11 @@ async def test_generic_repository_add_sqlalchemy_error(uow: IUnitOfWork) -> None
 
 
 @pytest.mark.anyio
+@pytest.mark.usefixtures("entity_without_id_mapping")
 async def test_generic_repository_delete_entity_without_id(
     session_factory: async_sessionmaker[AsyncSession],
 ) -> None:
     """Test that delete returns error when entity has no id attribute."""
-    from datetime import UTC, datetime
-
-    from sqlmodel import Field, SQLModel
-
-    @dataclass
-    class EntityWithoutId(IAuditable):
-        """Dummy entity without id attribute."""
-
-        name: str
-        created_at: datetime
-        updated_at: datetime
-
-    # Register a dummy ORM mapping for this entity
-    class EntityWithoutIdORM(SQLModel, table=True):
-        """ORM model for entity without id."""
-
-        __tablename__: str = "entity_without_id"  # type: ignore[assignment]
-
-        name: str = Field(primary_key=True)
-        created_at: datetime
-        updated_at: datetime
-
-    ORMMappingRegistry.register(EntityWithoutId, EntityWithoutIdORM)
-
     entity = EntityWithoutId(
         name="test", created_at=datetime.now(UTC), updated_at=datetime.now(UTC)
     )
@@ -138,17 +184,9 @@ async def test_generic_repository_delete_entity_without_id(
 @pytest.mark.anyio
 async def test_generic_repository_delete_non_existent_entity(
     uow: IUnitOfWork,
+    user: User,
 ) -> None:
     """Test that delete returns NOT_FOUND when entity doesn't exist in database."""
-    user = User.register(
-        display_name=DisplayName.from_primitive("NonExistent").expect(
-            "DisplayName.from_primitive should succeed"
-        ),
-        email=Email.from_primitive("nonexistent@example.com").expect(
-            "Email.from_primitive should succeed"
-        ),
-    )
-
     async with uow:
         repo = uow.GetRepository(User, UserId)
         result = await repo.delete(user)
@@ -158,46 +196,11 @@ async def test_generic_repository_delete_non_existent_entity(
         assert "not found" in result.error.message
 
 
-@pytest.mark.anyio
-async def test_generic_repository_delete_sqlalchemy_error(uow: IUnitOfWork) -> None:
-    """Test that delete returns RepositoryError on SQLAlchemy error."""
-    # First create a user
-    user = User.register(
-        display_name=DisplayName.from_primitive("ToDelete").expect(
-            "DisplayName.from_primitive should succeed"
-        ),
-        email=Email.from_primitive("delete@example.com").expect(
-            "Email.from_primitive should succeed"
-        ),
-    )
-
-    async with uow:
-        repo = uow.GetRepository(User)
-        add_result = await repo.add(user)
-        assert is_ok(add_result)
-        saved_user = add_result.value
-        await uow.commit()
-
-    # Now try to delete with SQLAlchemy error
-    async with uow:
-        repo = uow.GetRepository(User, UserId)
-
-        # Mock session.execute to raise SQLAlchemyError
-        with patch.object(
-            repo._session,  # type: ignore[attr-defined]
-            "execute",
-            side_effect=SQLAlchemyError("Delete error"),
-        ):
-            result = await repo.delete(saved_user)
-
-        assert is_err(result)
-        assert result.error.type == RepositoryErrorType.UNEXPECTED
-        assert "Delete error" in result.error.message
-
-
 @pytest.mark.anyio
 async def test_generic_repository_update_entity_deleted_during_version_check(
     uow: IUnitOfWork,
+    team: Team,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test update returns NOT_FOUND when entity is deleted during version check.
 
@@ -207,12 +210,6 @@ async def test_generic_repository_update_entity_deleted_during_version_check(
     This covers lines 150-154 in generic_repository.py
     """
     # Create a team
-    team = Team.form(
-        name=TeamName.from_primitive("Test Team").expect(
-            "TeamName.from_primitive should succeed"
-        ),
-    )
-
     async with uow:
         repo = uow.GetRepository(Team)
         add_result = await repo.add(team)
@@ -230,38 +227,33 @@ async def test_generic_repository_update_entity_deleted_during_version_check(
     async with uow:
         repo = uow.GetRepository(Team)
 
-        # Create mock objects for execute results
+        # Lightweight stand-ins for execute results
         # First execute: entity existence check - returns entity exists
-        existence_check_mock = MagicMock()
-        existence_check_mock.scalar_one_or_none.return_value = (
-            MagicMock()
-        )  # Entity exists
+        existence_check_result = SimpleNamespace(scalar_one_or_none=lambda: object())
 
         # Second execute: UPDATE statement returns rowcount=0 (version mismatch)
-        update_result_mock = MagicMock()
-        update_result_mock.rowcount = 0
+        update_result = SimpleNamespace(rowcount=0)
 
         # Third execute: Re-fetch for version conflict - returns None (entity deleted)
-        refetch_mock = MagicMock()
-        refetch_mock.scalar_one_or_none.return_value = None  # Entity was deleted
-
-        # Mock session.execute to return different results for each call
-        execute_mock = AsyncMock()
-        execute_mock.side_effect = [
-            existence_check_mock,
-            update_result_mock,
-            refetch_mock,
-        ]
-
-        with patch.object(
+        refetch_result = SimpleNamespace(scalar_one_or_none=lambda: None)
+
+        # Stub session.execute to return different results for each call
+        results = iter([existence_check_result, update_result, refetch_result])
+        execute_calls: list[object] = []
+
+        async def fake_execute(statement: object, *args: Any, **kwargs: Any) -> Any:
+            execute_calls.append(statement)
+            return next(results)
+
+        monkeypatch.setattr(
             repo._session,  # type: ignore[attr-defined]
             "execute",
-            execute_mock,  # type: ignore[attr-defined]
-        ):
-            result = await repo.update(updated_team)
+            fake_execute,
+        )
+        result = await repo.update(updated_team)
 
         assert is_err(result)
         assert result.error.type == RepositoryErrorType.NOT_FOUND
         assert "not found" in result.error.message
         # Verify execute was called three times (existence check + UPDATE + refetch)
-        assert execute_mock.call_count == 3
+        assert len(execute_calls) == 3
@@ -193,3 +193,54 @@ def test_unregistered_type_raises_error() -> None:
 
     with pytest.raises(ValueError, match="No ORM mapping registered"):
         ORMMappingRegistry.to_orm(dummy)
+
+
+def test_unregistered_orm_type_raises_error() -> None:
+    """Test that from_orm raises ValueError for an unregistered ORM type."""
+
+    class UnregisteredORM(SQLModel):
+        id: str
+
+    with pytest.raises(ValueError, match="No domain mapping registered"):
+        ORMMappingRegistry.from_orm(UnregisteredORM(id="test"))
+
+
+def test_reregistering_domain_type_keeps_orm_type_claimed_by_another(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that re-registering a domain type keeps other reverse mappings."""
+    monkeypatch.setattr(ORMMappingRegistry, "_domain_to_orm", {})
+    monkeypatch.setattr(ORMMappingRegistry, "_orm_to_domain", {})
+
+    @dataclass
+    class First:
+        name: str
+
+    @dataclass
+    class Second:
+        name: str
+
+    class SharedORM(SQLModel):
+        name: str
+
+    class OtherORM(SQLModel):
+        name: str
+
+    register_orm_mapping(First, SharedORM)
+    register_orm_mapping(Second, SharedORM)
+
+    # A shared ORM type resolves to the first domain type registered
+    assert isinstance(ORMMappingRegistry.from_orm(SharedORM(name="x")), First)
+
+    # Moving the later domain type away leaves the earlier one in place
+    register_orm_mapping(Second, OtherORM)
+    assert ORMMappingRegistry.get_orm_type(First) is SharedORM
+    assert isinstance(ORMMappingRegistry.from_orm(SharedORM(name="x")), First)
+    assert isinstance(ORMMappingRegistry.from_orm(OtherORM(name="x")), Second)
+
+    # Moving the earlier domain type away hands the ORM type to the other
+    register_orm_mapping(Second, SharedORM)
+    register_orm_mapping(First, OtherORM)
+    assert ORMMappingRegistry.get_orm_type(Second) is SharedORM
+    assert isinstance(ORMMappingRegistry.from_orm(SharedORM(name="x")), Second)
+    assert isinstance(ORMMappingRegistry.from_orm(OtherORM(name="x")), First)
@@ -1,14 +1,13 @@
 """Tests for infrastructure repository components."""
 
-import asyncio
 from datetime import UTC, datetime
 
 import pytest
 
-from app.core.result import Err, Ok, is_err
+from app.core.result import is_err, is_ok
 from app.domain.aggregates.user import User
 from app.domain.repositories import IUnitOfWork
-from app.domain.value_objects import DisplayName, Email, UserId
+from app.domain.value_objects import Email, UserId
 
 
 @pytest.mark.anyio
@@ -25,64 +24,48 @@ async def test_repository_get_non_existent_raises_error(uow: IUnitOfWork) -> Non
 
 
 @pytest.mark.anyio
-async def test_repository_delete(uow: IUnitOfWork) -> None:
+async def test_repository_delete(uow: IUnitOfWork, user: User) -> None:
     """Test deleting an entity via the repository."""
-    user = User.register(
-        display_name=DisplayName.from_primitive("ToDelete").expect(
-            "DisplayName.from_primitive should succeed"
-        ),
-        email=Email.from_primitive("delete@example.com").expect(
-            "Email.from_primitive should succeed for valid email"
-        ),
-    )
-    saved_user_result = None
-
-    # 1. Create user
     async with uow:
         repo = uow.GetRepository(User, UserId)
+
+        # 1. Create user
         saved_user_result = await repo.add(user)
-        assert isinstance(saved_user_result, Ok)
+        assert is_ok(saved_user_result)
         saved_user = saved_user_result.value
         assert saved_user.id  # ULID should exist
         commit_result = await uow.commit()
-        assert isinstance(commit_result, Ok)
+        assert is_ok(commit_result)
 
-    # 2. Delete user
-    async with uow:
-        repo = uow.GetRepository(User, UserId)
+        # 2. Delete user
         delete_result = await repo.delete(saved_user)
-        assert isinstance(delete_result, Ok)
+        assert is_ok(delete_result)
         commit_result = await uow.commit()
-        assert isinstance(commit_result, Ok)
+        assert is_ok(commit_result)
 
-    # 3. Verify user is deleted
-    async with uow:
-        repo = uow.GetRepository(User, UserId)
+        # 3. Verify user is deleted
         get_result = await repo.get_by_id(saved_user.id)
-        assert isinstance(get_result, Err)
+        assert is_err(get_result)
 
 
 @pytest.mark.anyio
-async def test_repository_saves_timestamps(uow: IUnitOfWork) -> None:
+async def test_repository_saves_timestamps(
+    uow: IUnitOfWork, user_template: User
+) -> None:
     """Test that repository correctly saves and retrieves timestamps."""
     before_creation = datetime.now(UTC)
 
     user = User.register(
-        display_name=DisplayName.from_primitive("TimestampTest").expect(
-            "DisplayName.from_primitive should succeed"
-        ),
-        email=Email.from_primitive("timestamp@example.com").expect(
-            "Email.from_primitive should succeed for valid email"
-        ),
+        display_name=user_template.display_name, email=user_template.email
     )
 
     async with uow:
         repo = uow.GetRepository(User)  # IRepository[User] - add only
         save_result = await repo.add(user)
-        assert isinstance(save_result, Ok)
+        assert is_ok(save_result)
         saved_user = save_result.value
         commit_result = await uow.commit()
-        assert isinstance(commit_result, Ok)
+        assert is_ok(commit_result)
 
     after_creation = datetime.now(UTC)
 
@@ -93,27 +76,19 @@ async def test_repository_saves_timestamps(uow: IUnitOfWork) -> None:
 
 
 @pytest.mark.anyio
-async def test_repository_updates_timestamp_on_save(uow: IUnitOfWork) -> None:
+@pytest.mark.usefixtures("advancing_clock")
+async def test_repository_updates_timestamp_on_save(
+    uow: IUnitOfWork, user: User
+) -> None:
     """Test that updated_at is automatically updated when saving existing entity."""
-    user = User.register(
-        display_name=DisplayName.from_primitive("UpdateTest").expect(
-            "DisplayName.from_primitive should succeed"
-        ),
-        email=Email.from_primitive("update@example.com").expect(
-            "Email.from_primitive should succeed for valid email"
-        ),
-    )
-
     async with uow:
         repo = uow.GetRepository(User)  # IRepository[User] - add only
         save_result = await repo.add(user)
-        assert isinstance(save_result, Ok)
+        assert is_ok(save_result)
         saved_user = save_result.value
         original_updated_at = saved_user.updated_at
         commit_result = await uow.commit()
-        assert isinstance(commit_result, Ok)
-
-    await asyncio.sleep(0.01)
+        assert is_ok(commit_result)
 
     saved_user.change_email(
         Email.from_primitive("updated@example.com").expect(
@@ -124,10 +99,10 @@ async def test_repository_updates_timestamp_on_save(uow: IUnitOfWork) -> None:
     async with uow:
         repo = uow.GetRepository(User)
         update_result = await repo.update(saved_user)
-        assert isinstance(update_result, Ok)
+        assert is_ok(update_result)
         updated_user = update_result.value
         commit_result = await uow.commit()
-        assert isinstance(commit_result, Ok)
+        assert is_ok(commit_result)
 
     assert updated_user.updated_at > original_updated_at
     assert updated_user.created_at == saved_user.created_at
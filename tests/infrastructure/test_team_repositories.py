@@ -1,6 +1,5 @@
 """Tests for Team repository components."""
 
-import asyncio
 from datetime import UTC, datetime
 
 import pytest
@@ -57,48 +56,37 @@ async def test_team_repository_get_non_existent_raises_error(
 
 
 @pytest.mark.anyio
-async def test_team_repository_delete(uow: IUnitOfWork) -> None:
+async def test_team_repository_delete(uow: IUnitOfWork, team: Team) -> None:
     """Test deleting a team via the repository."""
-    team = Team.form(
-        name=TeamName.from_primitive("ToDelete Team").expect(
-            "TeamName.from_primitive should succeed for valid name"
-        ),
-    )
-
-    # 1. Create team
     async with uow:
         repo = uow.GetRepository(Team, TeamId)
+
+        # 1. Create team
         saved_team_result = await repo.add(team)
         assert is_ok(saved_team_result)
         saved_team = saved_team_result.value
         commit_result = await uow.commit()
         assert is_ok(commit_result)
 
-    # 2. Delete team
-    async with uow:
-        repo = uow.GetRepository(Team, TeamId)
+        # 2. Delete team
         delete_result = await repo.delete(saved_team)
         assert is_ok(delete_result)
         commit_result = await uow.commit()
         assert is_ok(commit_result)
 
-    # 3. Verify team is deleted
-    async with uow:
-        repo = uow.GetRepository(Team, TeamId)
+        # 3. Verify team is deleted
         get_result = await repo.get_by_id(saved_team.id)
         assert is_err(get_result)
 
 
 @pytest.mark.anyio
-async def test_team_repository_saves_timestamps(uow: IUnitOfWork) -> None:
+async def test_team_repository_saves_timestamps(
+    uow: IUnitOfWork, team_template: Team
+) -> None:
     """Test that repository correctly saves and retrieves timestamps."""
     before_creation = datetime.now(UTC)
 
-    team = Team.form(
-        name=TeamName.from_primitive("Timestamp Team").expect(
-            "TeamName.from_primitive should succeed for valid name"
-        ),
-    )
+    team = Team.form(name=team_template.name)
 
     async with uow:
         repo = uow.GetRepository(Team)
@@ -117,14 +105,11 @@ async def test_team_repository_saves_timestamps(uow: IUnitOfWork) -> None:
 
 
 @pytest.mark.anyio
-async def test_team_repository_updates_timestamp_on_save(uow: IUnitOfWork) -> None:
+@pytest.mark.usefixtures("advancing_clock")
+async def test_team_repository_updates_timestamp_on_save(
+    uow: IUnitOfWork, team: Team
+) -> None:
     """Test that updated_at is automatically updated when saving existing team."""
-    team = Team.form(
-        name=TeamName.from_primitive("Update Team").expect(
-            "TeamName.from_primitive should succeed for valid name"
-        ),
-    )
-
     async with uow:
         repo = uow.GetRepository(Team)
         save_result = await repo.add(team)
@@ -134,8 +119,6 @@ async def test_team_repository_updates_timestamp_on_save(uow: IUnitOfWork) -> No
         commit_result = await uow.commit()
         assert is_ok(commit_result)
 
-    await asyncio.sleep(0.01)
-
     saved_team.change_name(
         TeamName.from_primitive("Updated Team").expect(
             "TeamName.from_primitive should succeed for valid name"
@@ -149,41 +132,28 @@ async def test_team_repository_updates_timestamp_on_save(uow: IUnitOfWork) -> No
         updated_team = update_result.value
         commit_result = await uow.commit()
         assert is_ok(commit_result)
-        # SQLite doesn't support microsecond precision well,
-        # so we just check it's not exactly the same
-        assert updated_team.updated_at != original_updated_at
+        assert updated_team.updated_at > original_updated_at
 
 
 @pytest.mark.anyio
 async def test_team_repository_concurrent_update_returns_version_conflict(
     uow: IUnitOfWork,
+    team: Team,
 ) -> None:
     """Test that concurrent updates to the same team return VERSION_CONFLICT."""
-    # Create initial team
-    team = Team.form(
-        name=TeamName.from_primitive("Concurrent Team").expect(
-            "TeamName.from_primitive should succeed"
-        ),
-    )
-
-    # Save team
+    # Save team, then load it twice to simulate two concurrent users
     async with uow:
-        repo = uow.GetRepository(Team)
+        repo = uow.GetRepository(Team, TeamId)
         save_result = await repo.add(team)
         assert is_ok(save_result)
         saved_team = save_result.value
         commit_result = await uow.commit()
         assert is_ok(commit_result)
 
-    # Simulate two concurrent updates by loading team twice
-    async with uow:
-        repo = uow.GetRepository(Team, TeamId)
         team1_result = await repo.get_by_id(saved_team.id)
         assert is_ok(team1_result)
         team1 = team1_result.value
 
-    async with uow:
-        repo = uow.GetRepository(Team, TeamId)
         team2_result = await repo.get_by_id(saved_team.id)
         assert is_ok(team2_result)
         team2 = team2_result.value
@@ -206,7 +176,7 @@ async def test_team_repository_concurrent_update_returns_version_conflict(
         commit_result = await uow.commit()
         assert is_ok(commit_result)
 
-    # Second update fails with VERSION_CONFLICT
+    # Second update fails with VERSION_CONFLICT, on a fresh session
     team2_updated = team2.change_name(
         TeamName.from_primitive("Updated by User 2").expect(
             "TeamName.from_primitive should succeed"
@@ -225,14 +195,9 @@ async def test_team_repository_concurrent_update_returns_version_conflict(
 @pytest.mark.anyio
 async def test_team_repository_version_increments_on_update(
     uow: IUnitOfWork,
+    team: Team,
 ) -> None:
     """Test that version increments correctly on each update."""
-    team = Team.form(
-        name=TeamName.from_primitive("Version Team").expect(
-            "TeamName.from_primitive should succeed"
-        ),
-    )
-
     # Initial save - version should be 0
     async with uow:
         repo = uow.GetRepository(Team)
@@ -251,14 +216,12 @@ async def test_team_repository_version_increments_on_update(
         team_v0 = get_result.value
         assert team_v0.version.to_primitive() == 0
 
-    team_v0_updated = team_v0.change_name(
-        TeamName.from_primitive("Updated Name 1").expect(
-            "TeamName.from_primitive should succeed"
+        team_v0_updated = team_v0.change_name(
+            TeamName.from_primitive("Updated Name 1").expect(
+                "TeamName.from_primitive should succeed"
+            )
         )
-    )
 
-    async with uow:
-        repo = uow.GetRepository(Team)
         update_result = await repo.update(team_v0_updated)
         assert is_ok(update_result)
         team_v1 = update_result.value
@@ -274,14 +237,12 @@ async def test_team_repository_version_increments_on_update(
         team_v1_loaded = get_result.value
         assert team_v1_loaded.version.to_primitive() == 1
 
-    team_v1_updated = team_v1_loaded.change_name(
-        TeamName.from_primitive("Updated Name 2").expect(
-            "TeamName.from_primitive should succeed"
+        team_v1_updated = team_v1_loaded.change_name(
+            TeamName.from_primitive("Updated Name 2").expect(
+                "TeamName.from_primitive should succeed"
+            )
         )
-    )
 
-    async with uow:
-        repo = uow.GetRepository(Team)
         update_result = await repo.update(team_v1_updated)
         assert is_ok(update_result)
         team_v2 = update_result.value
@@ -293,14 +254,9 @@ async def test_team_repository_version_increments_on_update(
 @pytest.mark.anyio
 async def test_team_repository_new_team_has_version_zero(
     uow: IUnitOfWork,
+    team: Team,
 ) -> None:
     """Test that newly created teams start with version 0."""
-    team = Team.form(
-        name=TeamName.from_primitive("New Team").expect(
-            "TeamName.from_primitive should succeed"
-        ),
-    )
-
     async with uow:
         repo = uow.GetRepository(Team)
         save_result = await repo.add(team)
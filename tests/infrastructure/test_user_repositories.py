@@ -5,23 +5,23 @@ import pytest
 from app.core.result import is_err, is_ok
 from app.domain.aggregates.user import User
 from app.domain.repositories import IUnitOfWork, RepositoryErrorType
-from app.domain.value_objects import DisplayName, Email, UserId
+from app.domain.value_objects import Email, UserId
+
+# Value objects are immutable, so validate the update targets once per module
+UPDATED_EMAIL_1 = Email.from_primitive("updated1@example.com").expect(
+    "Email.from_primitive should succeed"
+)
+UPDATED_EMAIL_2 = Email.from_primitive("updated2@example.com").expect(
+    "Email.from_primitive should succeed"
+)
 
 
 @pytest.mark.anyio
 async def test_user_repository_new_user_has_version_zero(
     uow: IUnitOfWork,
+    user: User,
 ) -> None:
     """Test that newly created users start with version 0."""
-    user = User.register(
-        display_name=DisplayName.from_primitive("New User").expect(
-            "DisplayName.from_primitive should succeed"
-        ),
-        email=Email.from_primitive("newuser@example.com").expect(
-            "Email.from_primitive should succeed"
-        ),
-    )
-
     async with uow:
         repo = uow.GetRepository(User)
         save_result = await repo.add(user)
@@ -43,17 +43,9 @@ async def test_user_repository_new_user_has_version_zero(
 @pytest.mark.anyio
 async def test_user_repository_version_increments_on_update(
     uow: IUnitOfWork,
+    user: User,
 ) -> None:
     """Test that version increments correctly on each update."""
-    user = User.register(
-        display_name=DisplayName.from_primitive("Version User").expect(
-            "DisplayName.from_primitive should succeed"
-        ),
-        email=Email.from_primitive("version@example.com").expect(
-            "Email.from_primitive should succeed"
-        ),
-    )
-
     # Initial save - version should be 0
     async with uow:
         repo = uow.GetRepository(User)
@@ -72,14 +64,8 @@ async def test_user_repository_version_increments_on_update(
         user_v0 = get_result.value
         assert user_v0.version.to_primitive() == 0
 
-    user_v0_updated = user_v0.change_email(
-        Email.from_primitive("version1@example.com").expect(
-            "Email.from_primitive should succeed"
-        )
-    )
+        user_v0_updated = user_v0.change_email(UPDATED_EMAIL_1)
 
-    async with uow:
-        repo = uow.GetRepository(User)
         update_result = await repo.update(user_v0_updated)
         assert is_ok(update_result)
         user_v1 = update_result.value
@@ -95,14 +81,8 @@ async def test_user_repository_version_increments_on_update(
         user_v1_loaded = get_result.value
         assert user_v1_loaded.version.to_primitive() == 1
 
-    user_v1_updated = user_v1_loaded.change_email(
-        Email.from_primitive("version2@example.com").expect(
-            "Email.from_primitive should succeed"
-        )
-    )
+        user_v1_updated = user_v1_loaded.change_email(UPDATED_EMAIL_2)
 
-    async with uow:
-        repo = uow.GetRepository(User)
         update_result = await repo.update(user_v1_updated)
         assert is_ok(update_result)
         user_v2 = update_result.value
@@ -114,18 +94,9 @@ async def test_user_repository_version_increments_on_update(
 @pytest.mark.anyio
 async def test_user_repository_concurrent_update_returns_version_conflict(
     uow: IUnitOfWork,
+    user: User,
 ) -> None:
     """Test that concurrent updates to the same user return VERSION_CONFLICT."""
-    # Create initial user
-    user = User.register(
-        display_name=DisplayName.from_primitive("Concurrent User").expect(
-            "DisplayName.from_primitive should succeed"
-        ),
-        email=Email.from_primitive("concurrent@example.com").expect(
-            "Email.from_primitive should succeed"
-        ),
-    )
-
     # Save user
     async with uow:
         repo = uow.GetRepository(User)
@@ -135,15 +106,15 @@ async def test_user_repository_concurrent_update_returns_version_conflict(
         commit_result = await uow.commit()
         assert is_ok(commit_result)
 
-    # Simulate two concurrent updates by loading user twice
+    # Simulate two concurrent clients that both fetched the same version.
+    # One read-only block is enough: the loaded aggregates are detached
+    # copies, and the conflict comes from the version each one carries.
     async with uow:
         repo = uow.GetRepository(User, UserId)
         user1_result = await repo.get_by_id(saved_user.id)
         assert is_ok(user1_result)
         user1 = user1_result.value
 
-    async with uow:
-        repo = uow.GetRepository(User, UserId)
         user2_result = await repo.get_by_id(saved_user.id)
         assert is_ok(user2_result)
         user2 = user2_result.value
@@ -152,11 +123,7 @@ async def test_user_repository_concurrent_update_returns_version_conflict(
     assert user1.version.to_primitive() == user2.version.to_primitive()
 
     # First update succeeds
-    user1_updated = user1.change_email(
-        Email.from_primitive("updated1@example.com").expect(
-            "Email.from_primitive should succeed"
-        )
-    )
+    user1_updated = user1.change_email(UPDATED_EMAIL_1)
     async with uow:
         repo = uow.GetRepository(User)
         update1_result = await repo.update(user1_updated)
@@ -167,11 +134,7 @@ async def test_user_repository_concurrent_update_returns_version_conflict(
         assert is_ok(commit_result)
 
     # Second update fails with VERSION_CONFLICT
-    user2_updated = user2.change_email(
-        Email.from_primitive("updated2@example.com").expect(
-            "Email.from_primitive should succeed"
-        )
-    )
+    user2_updated = user2.change_email(UPDATED_EMAIL_2)
     async with uow:
         repo = uow.GetRepository(User)
         update2_result = await repo.update(user2_updated)
@@ -1,6 +1,6 @@
 """Tests for Create Team use case."""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -8,6 +8,7 @@ from app.core.result import Err, is_err, is_ok
 from app.domain.repositories import IUnitOfWork, RepositoryError, RepositoryErrorType
 from app.usecases.result import ErrorType
 from app.usecases.teams.create_team import CreateTeamCommand, CreateTeamHandler
+from tests.fakes import FakeUnitOfWork
 
 
 @pytest.mark.anyio
@@ -25,52 +26,34 @@ async def test_create_team_handler(uow: IUnitOfWork) -> None:
 
 
 @pytest.mark.anyio
-async def test_create_team_handler_validation_error(uow: IUnitOfWork) -> None:
-    """Test CreateTeamHandler returns Err on validation error."""
-    handler = CreateTeamHandler(uow)
-
-    # Command with an empty name, which should fail domain validation
-    command = CreateTeamCommand(name="")
-    result = await handler.handle(command)
-
-    assert is_err(result)
-    assert result.error.type == ErrorType.VALIDATION_ERROR
-
-
-@pytest.mark.anyio
-async def test_create_team_handler_name_too_long(uow: IUnitOfWork) -> None:
-    """Test CreateTeamHandler returns Err when team name is too long."""
-    handler = CreateTeamHandler(uow)
-
-    # Command with a name exceeding max length (100 characters)
-    command = CreateTeamCommand(name="x" * 101)
+@pytest.mark.parametrize(
+    ("name", "message"),
+    [
+        ("", None),
+        ("x" * 101, "must not exceed 100 characters"),
+        ("  Team Name  ", "leading or trailing whitespace"),
+    ],
+    ids=["empty", "too_long", "whitespace"],
+)
+async def test_create_team_handler_validation_error(
+    fake_uow: FakeUnitOfWork, name: str, message: str | None
+) -> None:
+    """Test CreateTeamHandler returns Err when the team name is invalid."""
+    handler = CreateTeamHandler(fake_uow)
+
+    command = CreateTeamCommand(name=name)
     result = await handler.handle(command)
 
     assert is_err(result)
     assert result.error.type == ErrorType.VALIDATION_ERROR
-    assert "must not exceed 100 characters" in result.error.message
+    if message is not None:
+        assert message in result.error.message
 
 
 @pytest.mark.anyio
-async def test_create_team_handler_whitespace_validation(uow: IUnitOfWork) -> None:
-    """Test CreateTeamHandler returns Err when team name has whitespace."""
-    handler = CreateTeamHandler(uow)
-
-    # Command with leading/trailing whitespace
-    command = CreateTeamCommand(name="  Team Name  ")
-    result = await handler.handle(command)
-
-    assert is_err(result)
-    assert result.error.type == ErrorType.VALIDATION_ERROR
-    assert "leading or trailing whitespace" in result.error.message
-
-
-@pytest.mark.anyio
-async def test_create_team_handler_repository_error() -> None:
+async def test_create_team_handler_repository_error(fake_uow: FakeUnitOfWork) -> None:
     """Test CreateTeamHandler returns Err when repository fails."""
-    # Create a mock UnitOfWork that simulates repository error
-    mock_uow = MagicMock(spec=IUnitOfWork)
-    mock_repo = MagicMock()
+    mock_repo = fake_uow.repository
 
     # Mock the repository to return an Err
     mock_repo.add = AsyncMock(
@@ -82,11 +65,7 @@ async def test_create_team_handler_repository_error() -> None:
         )
     )
 
-    mock_uow.GetRepository.return_value = mock_repo
-    mock_uow.__aenter__ = AsyncMock(return_value=mock_uow)
-    mock_uow.__aexit__ = AsyncMock(return_value=None)
-
-    handler = CreateTeamHandler(mock_uow)
+    handler = CreateTeamHandler(fake_uow)
     command = CreateTeamCommand(name="Test Team")
     result = await handler.handle(command)
 
@@ -1,6 +1,6 @@
 """Tests for Update Team use case."""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -10,27 +10,15 @@ from app.domain.repositories import IUnitOfWork, RepositoryError, RepositoryErro
 from app.domain.value_objects import TeamId, TeamName
 from app.usecases.result import ErrorType
 from app.usecases.teams.update_team import UpdateTeamCommand, UpdateTeamHandler
+from tests.fakes import FakeUnitOfWork
+
+# Fixed ULID for tests that never insert a team, so no ID needs generating
+FIXED_TEAM_ID = "01ARZ3NDEKTSV4RRFFQ69G5FAV"
 
 
 @pytest.mark.anyio
-async def test_update_team_handler(uow: IUnitOfWork) -> None:
+async def test_update_team_handler(uow: IUnitOfWork, saved_team: Team) -> None:
     """Test UpdateTeamHandler updates team name successfully."""
-    # First, create a team
-    team = Team.form(
-        name=TeamName.from_primitive("Original Name").expect(
-            "TeamName.from_primitive should succeed for valid name"
-        ),
-    )
-
-    async with uow:
-        repo = uow.GetRepository(Team)
-        save_result = await repo.add(team)
-        assert is_ok(save_result)
-        saved_team = save_result.value
-        commit_result = await uow.commit()
-        assert is_ok(commit_result)
-
-    # Now test updating it
     handler = UpdateTeamHandler(uow)
     command = UpdateTeamCommand(
         team_id=saved_team.id.to_primitive(), new_name="Updated Name"
@@ -50,9 +38,7 @@ async def test_update_team_handler_not_found(uow: IUnitOfWork) -> None:
     handler = UpdateTeamHandler(uow)
 
     # Use a valid ULID that doesn't exist in the database
-    command = UpdateTeamCommand(
-        team_id="01ARZ3NDEKTSV4RRFFQ69G5FAV", new_name="New Name"
-    )
+    command = UpdateTeamCommand(team_id=FIXED_TEAM_ID, new_name="New Name")
     result = await handler.handle(command)
 
     assert is_err(result)
@@ -60,26 +46,11 @@ async def test_update_team_handler_not_found(uow: IUnitOfWork) -> None:
 
 
 @pytest.mark.anyio
-async def test_update_team_handler_validation_error(uow: IUnitOfWork) -> None:
+async def test_update_team_handler_validation_error(fake_uow: FakeUnitOfWork) -> None:
     """Test UpdateTeamHandler returns validation error for invalid name."""
-    # First, create a team
-    team = Team.form(
-        name=TeamName.from_primitive("Test Team").expect(
-            "TeamName.from_primitive should succeed for valid name"
-        ),
-    )
-
-    async with uow:
-        repo = uow.GetRepository(Team)
-        save_result = await repo.add(team)
-        assert is_ok(save_result)
-        saved_team = save_result.value
-        commit_result = await uow.commit()
-        assert is_ok(commit_result)
-
     # Try to update with empty name
-    handler = UpdateTeamHandler(uow)
-    command = UpdateTeamCommand(team_id=saved_team.id.to_primitive(), new_name="")
+    handler = UpdateTeamHandler(fake_uow)
+    command = UpdateTeamCommand(team_id=FIXED_TEAM_ID, new_name="")
     result = await handler.handle(command)
 
     assert is_err(result)
@@ -87,28 +58,11 @@ async def test_update_team_handler_validation_error(uow: IUnitOfWork) -> None:
 
 
 @pytest.mark.anyio
-async def test_update_team_handler_name_too_long(uow: IUnitOfWork) -> None:
+async def test_update_team_handler_name_too_long(fake_uow: FakeUnitOfWork) -> None:
     """Test UpdateTeamHandler returns validation error for name too long."""
-    # First, create a team
-    team = Team.form(
-        name=TeamName.from_primitive("Test Team").expect(
-            "TeamName.from_primitive should succeed for valid name"
-        ),
-    )
-
-    async with uow:
-        repo = uow.GetRepository(Team)
-        save_result = await repo.add(team)
-        assert is_ok(save_result)
-        saved_team = save_result.value
-        commit_result = await uow.commit()
-        assert is_ok(commit_result)
-
     # Try to update with name that's too long
-    handler = UpdateTeamHandler(uow)
-    command = UpdateTeamCommand(
-        team_id=saved_team.id.to_primitive(), new_name="x" * 101
-    )
+    handler = UpdateTeamHandler(fake_uow)
+    command = UpdateTeamCommand(team_id=FIXED_TEAM_ID, new_name="x" * 101)
     result = await handler.handle(command)
 
     assert is_err(result)
@@ -116,27 +70,14 @@ async def test_update_team_handler_name_too_long(uow: IUnitOfWork) -> None:
 
 
 @pytest.mark.anyio
-async def test_update_team_handler_concurrency_conflict(uow: IUnitOfWork) -> None:
+async def test_update_team_handler_concurrency_conflict(
+    uow: IUnitOfWork, saved_team: Team
+) -> None:
     """Test UpdateTeamHandler returns concurrency conflict for stale data.
 
     This test verifies that when two users try to update the same team
     concurrently, the second update fails with a VERSION_CONFLICT error.
     """
-    # Create a team
-    team = Team.form(
-        name=TeamName.from_primitive("Original Name").expect(
-            "TeamName.from_primitive should succeed for valid name"
-        ),
-    )
-
-    async with uow:
-        repo = uow.GetRepository(Team)
-        save_result = await repo.add(team)
-        assert is_ok(save_result)
-        saved_team = save_result.value
-        commit_result = await uow.commit()
-        assert is_ok(commit_result)
-
     # Simulate two users loading the team at the same time (both have version 0)
     async with uow:
         repo = uow.GetRepository(Team, TeamId)
@@ -144,8 +85,6 @@ async def test_update_team_handler_concurrency_conflict(uow: IUnitOfWork) -> Non
         assert is_ok(user1_team_result)
         user1_team = user1_team_result.value
 
-    async with uow:
-        repo = uow.GetRepository(Team, TeamId)
         user2_team_result = await repo.get_by_id(saved_team.id)
         assert is_ok(user2_team_result)
         user2_team = user2_team_result.value
@@ -182,9 +121,9 @@ async def test_update_team_handler_concurrency_conflict(uow: IUnitOfWork) -> Non
 
 
 @pytest.mark.anyio
-async def test_update_team_handler_invalid_team_id(uow: IUnitOfWork) -> None:
+async def test_update_team_handler_invalid_team_id(fake_uow: FakeUnitOfWork) -> None:
     """Test UpdateTeamHandler returns validation error for invalid team_id."""
-    handler = UpdateTeamHandler(uow)
+    handler = UpdateTeamHandler(fake_uow)
 
     # Invalid ULID format
     command = UpdateTeamCommand(team_id="invalid-id", new_name="New Name")
@@ -195,156 +134,70 @@ async def test_update_team_handler_invalid_team_id(uow: IUnitOfWork) -> None:
 
 
 @pytest.mark.anyio
-async def test_update_team_handler_get_unexpected_error() -> None:
-    """Test UpdateTeamHandler returns unexpected error when get_by_id fails."""
-    mock_uow = MagicMock(spec=IUnitOfWork)
-    mock_repo = MagicMock()
-
-    # Mock get_by_id to return an unexpected error
-    mock_repo.get_by_id = AsyncMock(
-        return_value=Err(
+@pytest.mark.parametrize(
+    ("failing_method", "repo_error", "expected_type", "expected_message"),
+    [
+        (
+            "get_by_id",
             RepositoryError(
                 type=RepositoryErrorType.UNEXPECTED,
                 message="Database connection failed",
-            )
-        )
-    )
-
-    mock_uow.GetRepository.return_value = mock_repo
-    mock_uow.__aenter__ = AsyncMock(return_value=mock_uow)
-    mock_uow.__aexit__ = AsyncMock(return_value=None)
-
-    handler = UpdateTeamHandler(mock_uow)
-    command = UpdateTeamCommand(
-        team_id="01ARZ3NDEKTSV4RRFFQ69G5FAV", new_name="New Name"
-    )
-    result = await handler.handle(command)
-
-    assert is_err(result)
-    assert result.error.type == ErrorType.UNEXPECTED
-    assert "Database connection failed" in result.error.message
-
-
-@pytest.mark.anyio
-async def test_update_team_handler_version_conflict_through_handler() -> None:
-    """Test UpdateTeamHandler returns concurrency conflict when version conflicts."""
-    mock_uow = MagicMock(spec=IUnitOfWork)
-    mock_repo = MagicMock()
-
-    # Create a mock team to return from get_by_id
-    team_id = TeamId.generate().expect("TeamId.generate should succeed")
-    team_name = TeamName.from_primitive("Original Name").expect(
-        "TeamName.from_primitive should succeed"
-    )
-    mock_team = Team.form(name=team_name)
-
-    # Mock get_by_id to return the team
-    mock_repo.get_by_id = AsyncMock(return_value=Ok(mock_team))
-
-    # Mock update to return a version conflict error
-    mock_repo.update = AsyncMock(
-        return_value=Err(
+            ),
+            ErrorType.UNEXPECTED,
+            "Database connection failed",
+        ),
+        (
+            "update",
             RepositoryError(
                 type=RepositoryErrorType.VERSION_CONFLICT,
                 message="Version conflict detected",
-            )
-        )
-    )
-
-    mock_uow.GetRepository.return_value = mock_repo
-    mock_uow.__aenter__ = AsyncMock(return_value=mock_uow)
-    mock_uow.__aexit__ = AsyncMock(return_value=None)
-
-    handler = UpdateTeamHandler(mock_uow)
-    command = UpdateTeamCommand(team_id=team_id.to_primitive(), new_name="Updated Name")
-    result = await handler.handle(command)
-
-    assert is_err(result)
-    assert result.error.type == ErrorType.CONCURRENCY_CONFLICT
-    assert "modified by another user" in result.error.message
-
-
-@pytest.mark.anyio
-async def test_update_team_handler_add_unexpected_error() -> None:
-    """Test UpdateTeamHandler returns unexpected error when add fails."""
-    mock_uow = MagicMock(spec=IUnitOfWork)
-    mock_repo = MagicMock()
-
-    # Create a mock team to return from get_by_id
-    team_id = TeamId.generate().expect("TeamId.generate should succeed")
-    team_name = TeamName.from_primitive("Original Name").expect(
-        "TeamName.from_primitive should succeed"
-    )
-    mock_team = Team.form(name=team_name)
-
-    # Mock get_by_id to return the team
-    mock_repo.get_by_id = AsyncMock(return_value=Ok(mock_team))
-
-    # Mock update to return an unexpected error
-    mock_repo.update = AsyncMock(
-        return_value=Err(
+            ),
+            ErrorType.CONCURRENCY_CONFLICT,
+            "modified by another user",
+        ),
+        (
+            "update",
             RepositoryError(
                 type=RepositoryErrorType.UNEXPECTED,
                 message="Database write failed",
-            )
-        )
-    )
-
-    mock_uow.GetRepository.return_value = mock_repo
-    mock_uow.__aenter__ = AsyncMock(return_value=mock_uow)
-    mock_uow.__aexit__ = AsyncMock(return_value=None)
-
-    handler = UpdateTeamHandler(mock_uow)
-    command = UpdateTeamCommand(team_id=team_id.to_primitive(), new_name="Updated Name")
-    result = await handler.handle(command)
-
-    assert is_err(result)
-    assert result.error.type == ErrorType.UNEXPECTED
-    assert "Database write failed" in result.error.message
-
-
-@pytest.mark.anyio
-async def test_update_team_handler_commit_failure() -> None:
-    """Test UpdateTeamHandler returns unexpected error when commit fails."""
-    mock_uow = MagicMock(spec=IUnitOfWork)
-    mock_repo = MagicMock()
-
-    # Create a mock team to return from get_by_id
-    team_id = TeamId.generate().expect("TeamId.generate should succeed")
-    team_name = TeamName.from_primitive("Original Name").expect(
-        "TeamName.from_primitive should succeed"
-    )
-    mock_team = Team.form(name=team_name)
-
-    # Mock get_by_id to return the team
-    mock_repo.get_by_id = AsyncMock(return_value=Ok(mock_team))
-
-    # Mock update to succeed
-    updated_team = Team.form(
-        name=TeamName.from_primitive("Updated Name").expect(
-            "TeamName.from_primitive should succeed"
+            ),
+            ErrorType.UNEXPECTED,
+            "Database write failed",
         ),
-    )
-    mock_repo.update = AsyncMock(return_value=Ok(updated_team))
-
-    # Mock commit to fail
-    mock_uow.commit = AsyncMock(
-        return_value=Err(
+        (
+            "commit",
             RepositoryError(
                 type=RepositoryErrorType.UNEXPECTED,
                 message="Transaction commit failed",
-            )
-        )
-    )
-
-    mock_uow.GetRepository.return_value = mock_repo
-    mock_uow.__aenter__ = AsyncMock(return_value=mock_uow)
-    mock_uow.__aexit__ = AsyncMock(return_value=None)
-
-    handler = UpdateTeamHandler(mock_uow)
-    command = UpdateTeamCommand(team_id=team_id.to_primitive(), new_name="Updated Name")
+            ),
+            ErrorType.UNEXPECTED,
+            "Transaction commit failed",
+        ),
+    ],
+    ids=["get_unexpected", "update_conflict", "update_unexpected", "commit_failure"],
+)
+async def test_update_team_handler_repository_failure(
+    fake_uow: FakeUnitOfWork,
+    team: Team,
+    failing_method: str,
+    repo_error: RepositoryError,
+    expected_type: ErrorType,
+    expected_message: str,
+) -> None:
+    """Test UpdateTeamHandler maps each repository failure to a use case error."""
+    mock_repo = fake_uow.repository
+
+    # Every step succeeds except the one under test
+    mock_repo.get_by_id = AsyncMock(return_value=Ok(team))
+    mock_repo.update = AsyncMock(return_value=Ok(team))
+
+    target = fake_uow if failing_method == "commit" else mock_repo
+    setattr(target, failing_method, AsyncMock(return_value=Err(repo_error)))
+
+    handler = UpdateTeamHandler(fake_uow)
+    command = UpdateTeamCommand(team_id=FIXED_TEAM_ID, new_name="Updated Name")
     result = await handler.handle(command)
 
     assert is_err(result)
-    assert result.error.type == ErrorType.UNEXPECTED
-    assert "Transaction commit failed" in result.error.message
+    assert result.error.type == expected_type
+    assert expected_message in result.error.message
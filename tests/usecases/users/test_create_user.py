@@ -1,6 +1,6 @@
 """Tests for Create User use case."""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -11,6 +11,7 @@ from app.usecases.users.create_user import (
     CreateUserCommand,
     CreateUserHandler,
 )
+from tests.fakes import FakeUnitOfWork
 
 
 @pytest.mark.anyio
@@ -28,9 +29,9 @@ async def test_create_user_handler(uow: IUnitOfWork) -> None:
 
 
 @pytest.mark.anyio
-async def test_create_user_handler_invalid_email(uow: IUnitOfWork) -> None:
+async def test_create_user_handler_invalid_email(fake_uow: FakeUnitOfWork) -> None:
     """Test CreateUserHandler returns Err on invalid email format."""
-    handler = CreateUserHandler(uow)
+    handler = CreateUserHandler(fake_uow)
 
     # Command with an invalid email format
     command = CreateUserCommand(display_name="Test User", email="invalid-email")
@@ -42,11 +43,9 @@ async def test_create_user_handler_invalid_email(uow: IUnitOfWork) -> None:
 
 
 @pytest.mark.anyio
-async def test_create_user_handler_repository_error() -> None:
+async def test_create_user_handler_repository_error(fake_uow: FakeUnitOfWork) -> None:
     """Test CreateUserHandler returns Err when repository fails."""
-    # Create a mock UnitOfWork that simulates repository error
-    mock_uow = MagicMock(spec=IUnitOfWork)
-    mock_repo = MagicMock()
+    mock_repo = fake_uow.repository
 
     # Mock the repository to return an Err
     mock_repo.add = AsyncMock(
@@ -58,11 +57,7 @@ async def test_create_user_handler_repository_error() -> None:
         )
     )
 
-    mock_uow.GetRepository.return_value = mock_repo
-    mock_uow.__aenter__ = AsyncMock(return_value=mock_uow)
-    mock_uow.__aexit__ = AsyncMock(return_value=None)
-
-    handler = CreateUserHandler(mock_uow)
+    handler = CreateUserHandler(fake_uow)
     command = CreateUserCommand(display_name="Test User", email="test@example.com")
     result = await handler.handle(command)
 
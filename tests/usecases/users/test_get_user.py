@@ -5,41 +5,35 @@ import pytest
 from app.core.result import is_err, is_ok
 from app.domain.aggregates.user import User
 from app.domain.repositories import IUnitOfWork
-from app.domain.value_objects import DisplayName, Email
 from app.usecases.result import ErrorType
 from app.usecases.users.get_user import GetUserHandler, GetUserQuery
+from tests.fakes import FakeRepository, FakeUnitOfWork
 
 
-@pytest.mark.anyio
-async def test_get_user_handler(uow: IUnitOfWork) -> None:
-    """Test GetUserHandler successfully returns a user."""
-    # Setup: Create user first
-    saved_user = None
-    async with uow:
-        repo = uow.GetRepository(User, str)
-        user = User.register(
-            display_name=DisplayName.from_primitive("Bob").expect(
-                "DisplayName.from_primitive should succeed for valid display name"
-            ),
-            email=Email.from_primitive("bob@example.com").expect(
-                "Email.from_primitive should succeed for valid email"
-            ),
-        )
-        save_result = await repo.add(user)
-        assert is_ok(save_result)
-        saved_user = save_result.value
-        commit_result = await uow.commit()
-        assert is_ok(commit_result)
-
-    # Test: Get user via handler
+async def _assert_handler_returns_user(uow: IUnitOfWork, user: User) -> None:
+    """Run GetUserHandler for ``user`` and check the flattened result."""
     handler = GetUserHandler(uow)
-    query = GetUserQuery(user_id=saved_user.id.to_primitive())
+    query = GetUserQuery(user_id=user.id.to_primitive())
     result = await handler.handle(query)
 
     assert is_ok(result)
-    assert result.value.id == saved_user.id.to_primitive()
-    assert result.value.display_name == "Bob"
-    assert result.value.email == "bob@example.com"
+    assert result.value.id == user.id.to_primitive()
+    assert result.value.display_name == user.display_name.to_primitive()
+    assert result.value.email == user.email.to_primitive()
+
+
+@pytest.mark.anyio
+async def test_get_user_handler(user: User) -> None:
+    """Test GetUserHandler returns a user served from an in-memory fake."""
+    await _assert_handler_returns_user(FakeUnitOfWork(FakeRepository([user])), user)
+
+
+@pytest.mark.anyio
+async def test_get_user_handler_from_database(
+    uow: IUnitOfWork, saved_user: User
+) -> None:
+    """Test GetUserHandler returns a user committed to the database."""
+    await _assert_handler_returns_user(uow, saved_user)
 
 
 @pytest.mark.anyio